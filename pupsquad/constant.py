@@ -1,6 +1,8 @@
 """Application constants."""
 import pathlib
 
+import pygame
+
 ROOT = pathlib.Path(__file__).resolve().parent
 
 SCREEN_WIDTH = 1280
@@ -11,3 +13,6 @@ SECONDS_PER_FRAME = 1/FRAMERATE
 METERS = 100  ## Amount of pixels per meter.
 GRAVITY = 9.81*METERS
 TILE_SIZE = 0.25*METERS
+
+BACKGROUND_COLOR = pygame.Color("grey")
+TILE_COLOR = pygame.Color("black")
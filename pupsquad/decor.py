@@ -1,34 +1,74 @@
 """Classes for level decor."""
+import functools
+
 import pygame
 
+from pupsquad.constant import BACKGROUND_COLOR
+from pupsquad.constant import ROOT
+from pupsquad.constant import TILE_COLOR
 from pupsquad.constant import TILE_SIZE
 
 
+def load_grid(fp):
+    """Load a decor grid from a text file, with one digit per tile kind."""
+    with open(ROOT/fp) as grid_file:
+        return [[int(kind) for kind in line.strip()] for line in grid_file]
+
+
+@functools.lru_cache(maxsize=None)
+def _tile_image():
+    """Create the tile image, shared by all tiles."""
+    image = pygame.Surface((TILE_SIZE, TILE_SIZE)).convert()
+    image.fill(TILE_COLOR)
+    return image
+
+
 class DecorTile(pygame.sprite.Sprite):
-    """A single tile in the decor."""
+    """A single impassable tile in the decor."""
 
-    def __init__(self, kind, x, y):
+    def __init__(self, x, y):
         super().__init__()
-        self.image = pygame.Surface((TILE_SIZE, TILE_SIZE))
+        self.image = _tile_image()
         self.rect = self.image.get_rect()
         self.rect.center = (x*TILE_SIZE, y*TILE_SIZE)
-        if kind == 0:
-            self.image.fill(pygame.Color("grey"))
-            self.passable = True
-        else:
-            self.image.fill(pygame.Color("black"))
-            self.passable = False
 
 
 class Decor:
-    """A collection of decor tiles, forming a level's decor."""
+    """A collection of decor tiles, forming a level's decor.
+
+    Grid cells of kind 0 are passable and left empty, all other kinds are
+    impassable tiles.
+    """
 
     def __init__(self, grid):
-        self.tiles = pygame.sprite.Group()
+        self.tiles = []
+        # Impassable tiles per grid row, as a bitmask over the columns.
+        self.impassable_rows = []
+        self.cell_size = int(TILE_SIZE)
+        # Tiles are centered on the grid points, so the grid starts half a
+        # tile up and left of the origin.
+        self.origin = (-(self.cell_size//2), -(self.cell_size//2))
         for row_index, row in enumerate(grid):
+            impassable_columns = 0
             for column_index, kind in enumerate(row):
-                tile = DecorTile(kind, column_index, row_index)
-                self.tiles.add(tile)
+                if kind == 0:
+                    continue
+                self.tiles.append(DecorTile(column_index, row_index))
+                impassable_columns |= 1 << column_index
+            self.impassable_rows.append(impassable_columns)
+        # The decor is static, so it is composed onto a single surface once.
+        size = (
+            max(len(row) for row in grid)*self.cell_size,
+            len(grid)*self.cell_size,
+        )
+        self.rect = pygame.Rect(self.origin, size)
+        self.image = pygame.Surface(self.rect.size).convert()
+        self.image.fill(BACKGROUND_COLOR)
+        offset = (-self.rect.x, -self.rect.y)
+        self.image.blits(
+            [(tile.image, tile.rect.move(offset)) for tile in self.tiles],
+            doreturn=False,
+        )
 
     def draw(self, screen):
-        self.tiles.draw(screen)
+        screen.blit(self.image, self.rect)
@@ -1,137 +1,141 @@
 """Base classes for all entities in the game, i.e. player, enemies and other."""
 import abc
+import functools
 
-import numpy as np
 import pygame
 
-from pupsquad.constant import GRAVITY
+import pupsquad.physics
 from pupsquad.constant import METERS
 from pupsquad.constant import SECONDS_PER_FRAME
 from pupsquad.constant import ROOT
 
 
-class Entity(pygame.sprite.Sprite, abc.ABC):
+class Entity(pygame.sprite.DirtySprite, abc.ABC):
     """Base class for entities, i.e. characters and objects."""
 
-    def __init__(self, position, initial_image_state):
+    def __init__(self, position, animation):
         super().__init__()
 
-        # Initial entity state.
-        self.position = position
+        # Initial entity state. The position is kept in whole pixels, like
+        # the rect it is drawn at.
+        self.px, self.py = round(position[0]), round(position[1])
 
-        # Entity image.
-        self.image_context = EntityImageContext(initial_image_state)
-        self.image = self.image_context.image
+        # Entity image, which is redrawn every frame.
+        self.dirty = 2
+        self.animation = animation
+        self.image = self.animation.image
         self.rect = self.image.get_rect()
         self.rect.center = self.position
 
+    @property
+    def position(self):
+        return (self.px, self.py)
+
     @abc.abstractmethod
     def update(self, level):
         """Update the entity state."""
-        # Update the entity image state.
-        self.image_context.update(self)
-        self.image = self.image_context.image
-        self.rect = self.image.get_rect()
+        # Update the entity animation.
+        self.animation.update(self)
+        self.image = self.animation.image
+        self.rect.size = self.image.get_size()
         self.rect.center = self.position
 
-    def draw(self, screen):
-        screen.blit(self.image, self.rect)
-
 
 class Character(Entity):
     """Base class for characters, i.e. the player and enemies."""
 
-    def __init__(self, position, initial_image_state, mass):
-        super().__init__(position, initial_image_state)
+    def __init__(self, position, animation, mass):
+        super().__init__(position, animation)
 
         # Initial entity state.
         self.mass = mass
-        self.velocity = np.array([0.*METERS, 0.*METERS])
-        self.force = np.array([0., 0.])
+        self.vx, self.vy = 0.*METERS, 0.*METERS
+        self.fx, self.fy = 0., 0.
         self.jumping = False
 
     def update(self, level):
         """Update the character state."""
         # Calculate position delta.
-        acceleration = self.force/self.mass - [0., GRAVITY]
-        self.velocity += acceleration*SECONDS_PER_FRAME
-        position_delta = np.round(self.velocity*SECONDS_PER_FRAME)
-        position_delta *= np.array([1, -1])
+        self.vx, self.vy, dx, dy = pupsquad.physics.integrate(
+            self.vx, self.vy, self.fx, self.fy, self.mass, SECONDS_PER_FRAME)
         # Check for collision with impassable decor.
-        for tile in level.decor.tiles:
-            if tile.passable:
-                continue
-            if tile.rect.colliderect(self.rect.move(position_delta[0], 0.)):
-                if position_delta[0] >= 0:
-                    position_delta[0] = tile.rect.left - self.rect.right
-                elif position_delta[0] < 0:
-                    position_delta[0] = tile.rect.right - self.rect.left
-            if tile.rect.colliderect(self.rect.move(0., position_delta[1])):
-                if position_delta[1] >= 0:
-                    position_delta[1] = tile.rect.top - self.rect.bottom
-                    self.jumping = False
-                elif position_delta[1] < 0:
-                    position_delta[1] = tile.rect.bottom - self.rect.top
-                self.velocity[1] = 0.
+        decor = level.decor
+        dx, dy, blocked, landed = pupsquad.physics.collide(
+            self.rect, dx, dy,
+            decor.impassable_rows, decor.cell_size, decor.origin,
+        )
+        if blocked:
+            self.vy = 0.
+        if landed:
+            self.jumping = False
         # Update the position.
-        self.position += position_delta
-        self.rect.center = self.position
-        # Update the character image state.
+        self.px += dx
+        self.py += dy
+        # Update the character animation.
         super().update(level)
 
 
-class EntityImageContext:
-    """The entity image context class."""
+@functools.lru_cache(maxsize=None)
+def _load_images(image_fps, width, height, flip):
+    """Load, scale and flip a sequence of images, once per distinct request."""
+    images = []
+    for fp in image_fps:
+        image = pygame.image.load(ROOT/fp).convert_alpha()
+        image = pygame.transform.scale(image, (width, height))
+        image = pygame.transform.flip(image, flip, False)
+        images.append(image)
+    return tuple(images)
 
-    _state = None
-    """The current entity image state."""
 
-    def __init__(self, state):
-        self.transition_to(state)
+class EntityAnimation:
+    """Base class for entity animations, a state machine driven by tables.
 
-    @property
-    def image(self):
-        return self._state.image
+    The animation state is a (state, facing) pair, where 'facing_right' is a
+    bool. Source images face left and are flipped when facing right.
+    """
 
-    def transition_to(self, state):
-        """Transition to another image state."""
-        self._state = state
-        self._state.context = self
+    __slots__ = (
+        "state", "facing_right", "images", "delay", "counter", "index")
 
-    def update(self, entity):
-        self._state.update(entity)
-
-
-class EntityImageState(abc.ABC):
-    """Abstract base class for entity image states."""
-
-    def __init__(self, image_fps, width, height, flip, delay):
-        self.images = []
-        for fp in image_fps:
-            width = int(width)
-            height = int(height)
-            image = pygame.image.load(ROOT/fp).convert_alpha()
-            image = pygame.transform.scale(image, (width, height))
-            image = pygame.transform.flip(image, flip, False)
-            self.images.append(image)
-        self.delay = delay
-        self.counter = 0
-        self.index = 0
+    width = None
+    """The width of the animation images."""
 
-    @property
-    def context(self):
-        return self._context
+    height = None
+    """The height of the animation images."""
+
+    frames = {}
+    """Image file paths and frame delay, per state."""
+
+    transitions = {}
+    """Transition function per state.
+
+    A transition function maps the entity velocity and current facing
+    '(vx, vy, facing_right)' to the next '(state, facing_right)'.
+    """
 
-    @context.setter
-    def context(self, context):
-        self._context = context
+    def __init__(self, state, facing_right):
+        self.transition_to(state, facing_right)
 
     @property
     def image(self):
         return self.images[self.index]
 
-    @abc.abstractmethod
+    def transition_to(self, state, facing_right):
+        """Transition to another state and facing."""
+        self.state = state
+        self.facing_right = facing_right
+        image_fps, self.delay = self.frames[state]
+        width, height = int(self.width), int(self.height)
+        self.images = _load_images(image_fps, width, height, facing_right)
+        self.counter = 0
+        self.index = 0
+
     def update(self, entity):
+        """Advance the animation and transition based on the entity."""
         self.counter = (self.counter+1) % self.delay
         if self.counter == 0:
             self.index = (self.index+1) % len(self.images)
+        transition = self.transitions[self.state]
+        state, facing_right = transition(entity.vx, entity.vy, self.facing_right)
+        if state != self.state or facing_right != self.facing_right:
+            self.transition_to(state, facing_right)
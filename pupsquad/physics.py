@@ -0,0 +1,76 @@
+"""Physics calculations for moving bodies, free of any game objects."""
+from pupsquad.constant import GRAVITY
+
+
+def integrate(vx, vy, fx, fy, mass, dt):
+    """Integrate a body's velocity over a time step.
+
+    Returns the new velocity and the resulting displacement, rounded to whole
+    pixels and in screen coordinates, i.e. with the y-axis pointing down.
+    """
+    ax = fx/mass
+    ay = fy/mass - GRAVITY
+    vx += ax*dt
+    vy += ay*dt
+    dx = round(vx*dt)
+    dy = -round(vy*dt)
+    return vx, vy, dx, dy
+
+
+def _span(low, high, origin, cell_size):
+    """Return the index range of the grid cells covering [low, high)."""
+    return (low-origin)//cell_size, (high-1-origin)//cell_size + 1
+
+
+def collide(rect, dx, dy, impassable_rows, cell_size, origin):
+    """Limit the displacement of a rect so that it stays out of a grid.
+
+    The grid's impassable cells are given per row as a bitmask, where bit 'i'
+    is set if the cell in column 'i' is impassable. Cells are squares of
+    'cell_size' pixels, with the top left of cell (0, 0) at pixel 'origin'.
+
+    Both axes are resolved independently, by snapping the rect to the nearest
+    impassable cell it would overlap. Returns the limited displacement,
+    whether the rect was blocked vertically and whether it landed on top of
+    an impassable cell.
+    """
+    left, top, right, bottom = rect.left, rect.top, rect.right, rect.bottom
+    origin_x, origin_y = origin
+    # Horizontal: look for impassable columns under the moved rect, in any of
+    # the rows the rect spans.
+    first_row, end_row = _span(top, bottom, origin_y, cell_size)
+    first_column, end_column = _span(left+dx, right+dx, origin_x, cell_size)
+    first_row, first_column = max(first_row, 0), max(first_column, 0)
+    if first_row < end_row and first_column < end_column:
+        columns = 0
+        for impassable_columns in impassable_rows[first_row:end_row]:
+            columns |= impassable_columns
+        span = (1 << (end_column-first_column)) - 1
+        columns = (columns >> first_column) & span
+        if columns:
+            if dx >= 0:
+                column = first_column + (columns & -columns).bit_length() - 1
+                dx = origin_x + column*cell_size - right
+            else:
+                column = first_column + columns.bit_length() - 1
+                dx = origin_x + (column+1)*cell_size - left
+    # Vertical: look for the nearest row under the moved rect that has an
+    # impassable cell in one of the columns the rect spans.
+    blocked = False
+    landed = dy >= 0
+    first_row, end_row = _span(top+dy, bottom+dy, origin_y, cell_size)
+    first_column, end_column = _span(left, right, origin_x, cell_size)
+    first_row, first_column = max(first_row, 0), max(first_column, 0)
+    end_row = min(end_row, len(impassable_rows))
+    if first_column < end_column:
+        columns = ((1 << (end_column-first_column)) - 1) << first_column
+        rows = range(first_row, end_row)
+        for row in rows if landed else reversed(rows):
+            if impassable_rows[row] & columns:
+                blocked = True
+                if landed:
+                    dy = origin_y + row*cell_size - bottom
+                else:
+                    dy = origin_y + (row+1)*cell_size - top
+                break
+    return dx, dy, blocked, blocked and landed
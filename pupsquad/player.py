@@ -5,220 +5,140 @@ import pupsquad.entity
 from pupsquad.constant import GRAVITY
 from pupsquad.constant import METERS
 
+IDLE = "idle"
+RUN = "run"
+JUMP = "jump"
+FALL = "fall"
+
 
 class Player(pupsquad.entity.Character):
     """The player character."""
 
     def __init__(self, position):
         # General entity settings.
-        initial_image_state = PlayerIdleRight()
+        animation = PlayerAnimation(IDLE, facing_right=True)
         mass = 35.
-        super().__init__(position, initial_image_state, mass)
+        super().__init__(position, animation, mass)
         # Player-specific settings.
         self.run_speed = 4.*METERS
         self.jump_height = 1.5*METERS
+        self._jump_velocity = (2*GRAVITY*self.jump_height)**0.5
 
     def handle_event(self, event):
         """Handle an event."""
         if event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_SPACE:
-                self.jump()
-            elif event.key == pygame.K_a:
-                self.start_run_left()
-            elif event.key == pygame.K_d:
-                self.start_run_right()
+            handler = self.key_down_handlers.get(event.key)
         elif event.type == pygame.KEYUP:
-            if event.key == pygame.K_a:
-                self.stop_run_left()
-            elif event.key == pygame.K_d:
-                self.stop_run_right()
+            handler = self.key_up_handlers.get(event.key)
+        else:
+            return
+        if handler is not None:
+            handler(self)
 
     def jump(self):
         if self.jumping:
             return
-        jump_velocity = (2*GRAVITY*self.jump_height)**0.5
-        self.velocity[1] += jump_velocity
+        self.vy += self._jump_velocity
         self.jumping = True
 
     def start_run_left(self):
-        self.velocity[0] -= self.run_speed
+        self.vx -= self.run_speed
 
     def stop_run_left(self):
-        self.velocity[0] += self.run_speed
+        self.vx += self.run_speed
 
     def start_run_right(self):
-        self.velocity[0] += self.run_speed
+        self.vx += self.run_speed
 
     def stop_run_right(self):
-        self.velocity[0] -= self.run_speed
-
-
-class PlayerImageState(pupsquad.entity.EntityImageState):
-    """Base class for player image states."""
-
-    def __init__(self, image_fps, flip=True, delay=10):
-        width = 1.15*METERS
-        height = 0.74*METERS
-        super().__init__(image_fps, width, height, flip, delay)
-
-
-class PlayerIdleRight(PlayerImageState):
-    """Image state for player idle, facing right."""
-
-    def __init__(self):
-        image_fps = [
-            "assets/player/idle/1.png",
-            "assets/player/idle/2.png",
-        ]
-        super().__init__(image_fps)
-
-    def update(self, entity):
-        super().update(entity)
-        if entity.velocity[1] < -0.5*METERS:
-            self.context.transition_to(PlayerFallRight())
-        elif entity.velocity[1] > 0:
-            self.context.transition_to(PlayerJumpRight())
-        elif entity.velocity[0] < 0:
-            self.context.transition_to(PlayerRunLeft())
-        elif entity.velocity[0] > 0:
-            self.context.transition_to(PlayerRunRight())
-
-
-class PlayerIdleLeft(PlayerImageState):
-    """Image state for player idle, facing left."""
-
-    def __init__(self):
-        image_fps = [
-            "assets/player/idle/1.png",
-            "assets/player/idle/2.png",
-        ]
-        super().__init__(image_fps, flip=False)
-
-    def update(self, entity):
-        super().update(entity)
-        if entity.velocity[1] < -0.5*METERS:
-            self.context.transition_to(PlayerFallLeft())
-        elif entity.velocity[1] > 0:
-            self.context.transition_to(PlayerJumpLeft())
-        elif entity.velocity[0] < 0:
-            self.context.transition_to(PlayerRunLeft())
-        elif entity.velocity[0] > 0:
-            self.context.transition_to(PlayerRunRight())
-
-
-class PlayerRunRight(PlayerImageState):
-    """Image state for player running, facing right."""
-
-    def __init__(self):
-        image_fps = [
-            "assets/player/run/1.png",
-            "assets/player/run/2.png",
-            "assets/player/run/3.png",
-            "assets/player/run/4.png",
-            "assets/player/run/5.png",
-        ]
-        super().__init__(image_fps, delay=5)
-
-    def update(self, entity):
-        super().update(entity)
-        if entity.velocity[1] < -0.5*METERS:
-            self.context.transition_to(PlayerFallRight())
-        elif entity.velocity[1] > 0:
-            self.context.transition_to(PlayerJumpRight())
-        elif entity.velocity[0] < 0:
-            self.context.transition_to(PlayerRunLeft())
-        elif entity.velocity[0] == 0:
-            self.context.transition_to(PlayerIdleRight())
-
-
-class PlayerRunLeft(PlayerImageState):
-    """Image state for player running, facing left."""
-
-    def __init__(self):
-        image_fps = [
-            "assets/player/run/1.png",
-            "assets/player/run/2.png",
-            "assets/player/run/3.png",
-            "assets/player/run/4.png",
-            "assets/player/run/5.png",
-        ]
-        super().__init__(image_fps, flip=False, delay=5)
-
-    def update(self, entity):
-        super().update(entity)
-        if entity.velocity[1] < -0.5*METERS:
-            self.context.transition_to(PlayerFallLeft())
-        elif entity.velocity[1] > 0:
-            self.context.transition_to(PlayerJumpLeft())
-        elif entity.velocity[0] > 0:
-            self.context.transition_to(PlayerRunRight())
-        elif entity.velocity[0] == 0:
-            self.context.transition_to(PlayerIdleLeft())
-
-
-class PlayerJumpRight(PlayerImageState):
-    """Image state for player jumping, facing right."""
-
-    def __init__(self):
-        image_fps = [
-            "assets/player/jump/1.png",
-        ]
-        super().__init__(image_fps)
-
-    def update(self, entity):
-        super().update(entity)
-        if entity.velocity[1] < 0.:
-            self.context.transition_to(PlayerFallRight())
-        elif entity.velocity[0] < 0.:
-            self.context.transition_to(PlayerJumpLeft())
-
-
-class PlayerJumpLeft(PlayerImageState):
-    """Image state for player jumping, facing left."""
-
-    def __init__(self):
-        image_fps = [
-            "assets/player/jump/1.png",
-        ]
-        super().__init__(image_fps, flip=False)
-
-    def update(self, entity):
-        super().update(entity)
-        if entity.velocity[1] < 0.:
-            self.context.transition_to(PlayerFallLeft())
-        elif entity.velocity[0] > 0.:
-            self.context.transition_to(PlayerJumpRight())
-
-
-class PlayerFallRight(PlayerImageState):
-    """Image state for player falling, facing right."""
-
-    def __init__(self):
-        image_fps = [
-            "assets/player/fall/1.png",
-        ]
-        super().__init__(image_fps)
-
-    def update(self, entity):
-        super().update(entity)
-        if entity.velocity[1] == 0:
-            self.context.transition_to(PlayerIdleRight())
-        elif entity.velocity[0] < 0.:
-            self.context.transition_to(PlayerFallLeft())
-
-
-class PlayerFallLeft(PlayerImageState):
-    """Image state for player falling, facing left."""
-
-    def __init__(self):
-        image_fps = [
-            "assets/player/fall/1.png",
-        ]
-        super().__init__(image_fps, flip=False)
-
-    def update(self, entity):
-        super().update(entity)
-        if entity.velocity[1] == 0:
-            self.context.transition_to(PlayerIdleLeft())
-        elif entity.velocity[0] > 0.:
-            self.context.transition_to(PlayerFallRight())
+        self.vx -= self.run_speed
+
+    key_down_handlers = {
+        pygame.K_SPACE: jump,
+        pygame.K_a: start_run_left,
+        pygame.K_d: start_run_right,
+    }
+    """Handler per key, for key presses."""
+
+    key_up_handlers = {
+        pygame.K_a: stop_run_left,
+        pygame.K_d: stop_run_right,
+    }
+    """Handler per key, for key releases."""
+
+
+def _facing_right(vx, facing_right):
+    """Face the direction of horizontal motion, if any."""
+    if vx < 0:
+        return False
+    elif vx > 0:
+        return True
+    return facing_right
+
+
+def _idle_or_run_transition(vx, vy, facing_right):
+    if vy < -0.5*METERS:
+        return FALL, facing_right
+    elif vy > 0:
+        return JUMP, facing_right
+    elif vx == 0:
+        return IDLE, facing_right
+    return RUN, _facing_right(vx, facing_right)
+
+
+def _jump_transition(vx, vy, facing_right):
+    if vy < 0.:
+        return FALL, facing_right
+    return JUMP, _facing_right(vx, facing_right)
+
+
+def _fall_transition(vx, vy, facing_right):
+    if vy == 0:
+        return IDLE, facing_right
+    return FALL, _facing_right(vx, facing_right)
+
+
+class PlayerAnimation(pupsquad.entity.EntityAnimation):
+    """The player animation."""
+
+    __slots__ = ()
+
+    width = 1.15*METERS
+    height = 0.74*METERS
+    frames = {
+        IDLE: (
+            (
+                "assets/player/idle/1.png",
+                "assets/player/idle/2.png",
+            ),
+            10,
+        ),
+        RUN: (
+            (
+                "assets/player/run/1.png",
+                "assets/player/run/2.png",
+                "assets/player/run/3.png",
+                "assets/player/run/4.png",
+                "assets/player/run/5.png",
+            ),
+            5,
+        ),
+        JUMP: (
+            (
+                "assets/player/jump/1.png",
+            ),
+            10,
+        ),
+        FALL: (
+            (
+                "assets/player/fall/1.png",
+            ),
+            10,
+        ),
+    }
+    transitions = {
+        IDLE: _idle_or_run_transition,
+        RUN: _idle_or_run_transition,
+        JUMP: _jump_transition,
+        FALL: _fall_transition,
+    }
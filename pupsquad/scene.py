@@ -3,6 +3,7 @@ import abc
 
 import pygame
 
+from pupsquad.constant import BACKGROUND_COLOR
 from pupsquad.constant import FRAMERATE
 
 
@@ -34,9 +35,8 @@ class SceneContext:
                 self._scene.handle_event(event)
             # Update state.
             self._scene.update()
-            # Draw.
-            self._scene.draw(screen)
-            pygame.display.flip()
+            # Draw, only updating the parts of the display that changed.
+            pygame.display.update(self._scene.draw(screen))
             clock.tick(FRAMERATE)
 
 
@@ -61,6 +61,10 @@ class Scene(abc.ABC):
 
     @abc.abstractmethod
     def draw(self, screen):
+        """Draw the scene, returning the list of screen areas that changed.
+
+        The first draw of a scene must repaint, and return, the whole screen.
+        """
         pass
 
 
@@ -70,15 +74,24 @@ class Level(Scene):
     def __init__(self, player, decor):
         self.player = player
         self.decor = decor
+        self.sprites = pygame.sprite.LayeredDirty(self.player)
+        self._background = None
 
     def handle_event(self, event):
         self.player.handle_event(event)
 
     def update(self):
-        # Calculate the time delta for physics calculations.
         self.player.update(self)
 
     def draw(self, screen):
-        screen.fill(pygame.Color("grey"))
-        self.decor.draw(screen)
-        self.player.draw(screen)
+        if self._background is None:
+            # The decor is static, so it is drawn once onto a background that
+            # the sprites are cleared with. After that, only the old and new
+            # areas of the sprites need repainting.
+            self._background = pygame.Surface(screen.get_size()).convert()
+            self._background.fill(BACKGROUND_COLOR)
+            self.decor.draw(self._background)
+            screen.blit(self._background, (0, 0))
+            self.sprites.draw(screen, self._background)
+            return [screen.get_rect()]
+        return self.sprites.draw(screen)